@@ -48,7 +48,7 @@ def check_ollama():
         return False
 
 def check_ollama_service():
-    """Check if Ollama service is running."""
+    """Check if Ollama service is running. Returns the /api/tags response, or None."""
     print("\n Checking if Ollama service is running...")
     
     try:
@@ -56,16 +56,16 @@ def check_ollama_service():
         response = requests.get("http://localhost:11434/api/tags", timeout=5)
         if response.status_code == 200:
             print(" Ollama service is running")
-            return True
+            return response.json()
         else:
             print(" Ollama service not responding")
-            return False
+            return None
     except Exception as e:
         print(f" Cannot connect to Ollama service: {e}")
-        return False
+        return None
 
-def check_models():
-    """Check if required models are available."""
+def check_models(tags):
+    """Check if required models are available in the /api/tags response."""
     print("\n Checking for required models...")
     
     # Check embedding model (will be downloaded automatically)
@@ -73,29 +73,23 @@ def check_models():
     
     # Check Ollama models
     try:
-        import requests
-        response = requests.get("http://localhost:11434/api/tags", timeout=5)
-        if response.status_code == 200:
-            models = response.json().get("models", [])
-            if models:
-                print(f" Found {len(models)} Ollama models:")
-                for model in models:
-                    print(f"   - {model['name']} ({model['size']})")
-                
-                # Check if our target model is available
-                target_model = "llama3.2:3b"
-                model_names = [m['name'] for m in models]
-                if target_model in model_names:
-                    print(f" Target model '{target_model}' is available")
-                    return True
-                else:
-                    print(f" Target model '{target_model}' not found")
-                    return False
+        models = tags.get("models", [])
+        if models:
+            print(f" Found {len(models)} Ollama models:")
+            for model in models:
+                print(f"   - {model['name']} ({model['size']})")
+            
+            # Check if our target model is available
+            target_model = "llama3.2:3b"
+            model_names = [m['name'] for m in models]
+            if target_model in model_names:
+                print(f" Target model '{target_model}' is available")
+                return True
             else:
-                print(" No Ollama models found")
+                print(f" Target model '{target_model}' not found")
                 return False
         else:
-            print(" Ollama service not responding")
+            print(" No Ollama models found")
             return False
     except Exception as e:
         print(f" Error checking models: {e}")
@@ -157,13 +151,14 @@ def main():
         sys.exit(1)
     
     # Check Ollama service
-    if not check_ollama_service():
+    tags = check_ollama_service()
+    if tags is None:
         print("\n Start Ollama service:")
         print("ollama serve")
         sys.exit(1)
     
-    # Check models
-    models_available = check_models()
+    # Check models, reusing the model list fetched above
+    models_available = check_models(tags)
     
     if not models_available:
         download_model_instructions()
@@ -5,6 +5,7 @@ Test script for the Offline Transcript Q&A System
 
 import sys
 import os
+import asyncio
 
 def test_imports():
     """Test if all required modules can be imported."""
@@ -31,6 +32,20 @@ def test_imports():
         print(" requests import failed")
         return False
     
+    try:
+        import orjson
+        print(" orjson imported successfully")
+    except ImportError:
+        print(" orjson import failed")
+        return False
+    
+    try:
+        import httpx
+        print(" httpx imported successfully")
+    except ImportError:
+        print(" httpx import failed")
+        return False
+    
     return True
 
 def test_transcript_loading():
@@ -56,7 +71,7 @@ def test_transcript_loading():
     return True
 
 def test_qa_system():
-    """Test if the Q&A system can be initialized."""
+    """Test if the Q&A system can be initialized. Returns the system, or None on failure."""
     print("\n Testing Q&A system initialization...")
     
     try:
@@ -68,22 +83,21 @@ def test_qa_system():
         qa_system = TranscriptQASystem()
         print(" Q&A system initialized successfully!")
         
-        return True
+        return qa_system
         
     except Exception as e:
         print(f" Failed to initialize Q&A system: {e}")
-        return False
+        return None
 
-def run_sample_questions():
+def run_sample_questions(qa_system):
     """Run a few sample questions to test the system."""
     print("\n Testing sample questions...")
     
+    if qa_system is None:
+        print(" Skipping sample questions: Q&A system failed to initialize")
+        return False
+    
     try:
-        from transcript_qa import TranscriptQASystem
-        
-        # Initialize system
-        qa_system = TranscriptQASystem()
-        
         # Sample questions
         sample_questions = [
             "What are the pricing options for lawn mowing?",
@@ -91,16 +105,27 @@ def run_sample_questions():
             "Do they offer bagging services?"
         ]
         
-        for question in sample_questions:
+        # Ask all questions concurrently so retrieval and generation overlap
+        async def ask_all():
+            try:
+                return await asyncio.gather(
+                    *(qa_system.aanswer_question(question) for question in sample_questions),
+                    return_exceptions=True
+                )
+            finally:
+                await qa_system.aclose()
+        
+        answers = asyncio.run(ask_all())
+        
+        for question, answer in zip(sample_questions, answers):
             print(f"\nQuestion: {question}")
             print("-" * 50)
             
-            try:
-                answer = qa_system.answer_question(question)
+            if isinstance(answer, Exception):
+                print(f" Failed to answer question: {answer}")
+            else:
                 print(f"Answer: {answer}")
                 print(" Question answered successfully")
-            except Exception as e:
-                print(f" Failed to answer question: {e}")
         
         return True
         
@@ -125,11 +150,12 @@ def main():
         tests_passed += 1
     
     # Test 3: Q&A system initialization
-    if test_qa_system():
+    qa_system = test_qa_system()
+    if qa_system is not None:
         tests_passed += 1
     
-    # Test 4: Sample questions (optional - comment out if you want to skip)
-    if run_sample_questions():
+    # Test 4: Sample questions, reusing the system from test 3 (optional - comment out if you want to skip)
+    if run_sample_questions(qa_system):
         tests_passed += 1
     
     # Results
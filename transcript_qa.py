@@ -11,46 +11,202 @@ Requirements:
 - sentence-transformers (for embeddings)
 - local llm
 - numpy (for similarity calculations)
+- orjson (for fast JSON encoding of Ollama requests)
+- httpx (for concurrent async requests to Ollama)
+- faiss-cpu (optional, for faster similarity search)
+- onnxruntime (optional, for faster embeddings from an exported ONNX model)
 - glob (built-in, for file loading)
 """
 
 import os
+import asyncio
+import atexit
+import copy
 import glob
+import hashlib
+import queue
 import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Tuple, Dict
 import numpy as np
-from sentence_transformers import SentenceTransformer
 import requests
-import json
+from requests.adapters import HTTPAdapter
+import httpx
+import orjson
+
+try:
+    import faiss  # optional: faster similarity search
+except ImportError:
+    faiss = None
+
+try:
+    import onnxruntime as ort  # optional: faster embeddings
+except ImportError:
+    ort = None
+
+# Timestamp lines in transcripts (e.g., "0:02", "1:15")
+TIMESTAMP_RE = re.compile(r'^[ \t]*\d+:\d+[ \t\r]*$', re.MULTILINE)
+# Leading/trailing quote characters the LLM sometimes wraps answers in
+QUOTE_STRIP_RE = re.compile(r'^["\']|["\']$')
+# Punctuation ignored when matching repeated questions
+PUNCTUATION_RE = re.compile(r'[^\w\s]')
+
+class OnnxEmbeddingModel:
+    """
+    Minimal stand-in for SentenceTransformer that runs an ONNX export of the
+    embedding model with ONNX Runtime, avoiding the PyTorch runtime entirely.
+    
+    Export the model once with:
+        optimum-cli export onnx --model sentence-transformers/all-MiniLM-L6-v2 onnx_model/
+    """
+    
+    def __init__(self, model_dir: str, max_seq_length: int = 256):
+        """
+        Load the ONNX model and its tokenizer.
+        
+        Args:
+            model_dir: Directory containing model.onnx and the tokenizer files
+            max_seq_length: Maximum number of tokens per input text
+        """
+        from transformers import AutoTokenizer
+        
+        self.tokenizer = AutoTokenizer.from_pretrained(model_dir)
+        self.session = ort.InferenceSession(
+            os.path.join(model_dir, "model.onnx"),
+            providers=["CPUExecutionProvider"]
+        )
+        self.input_names = {model_input.name for model_input in self.session.get_inputs()}
+        # Exports name the per-token output differently depending on the optimum version
+        output_names = [output.name for output in self.session.get_outputs()]
+        self.output_name = next((name for name in output_names
+                                 if name in ("token_embeddings", "last_hidden_state")), output_names[0])
+        self.max_seq_length = max_seq_length
+    
+    def encode(self, sentences: List[str], batch_size: int = 32, normalize_embeddings: bool = False,
+               **kwargs) -> np.ndarray:
+        """
+        Embed texts with mean pooling over token embeddings.
+        
+        Args:
+            sentences: Texts to embed
+            batch_size: Number of texts per inference call
+            normalize_embeddings: Scale each embedding to unit length
+            **kwargs: Accepted for SentenceTransformer.encode compatibility and ignored
+            
+        Returns:
+            Float32 array of shape (len(sentences), embedding_dim)
+        """
+        # Batch texts of similar length together to minimize padding
+        order = np.argsort([-len(sentence) for sentence in sentences], kind="stable")
+        batches = []
+        
+        for start in range(0, len(sentences), batch_size):
+            batch = [sentences[i] for i in order[start:start + batch_size]]
+            inputs = self.tokenizer(batch, padding=True, truncation=True,
+                                    max_length=self.max_seq_length, return_tensors="np")
+            feed = {name: inputs[name].astype(np.int64) for name in self.input_names}
+            token_embeddings = self.session.run([self.output_name], feed)[0]
+            
+            # Mean-pool over real (non-padding) tokens
+            mask = inputs["attention_mask"][:, :, np.newaxis].astype(np.float32)
+            batches.append((token_embeddings * mask).sum(axis=1) / np.maximum(mask.sum(axis=1), 1e-9))
+        
+        if not batches:
+            return np.empty((0, 0), dtype=np.float32)
+        
+        embeddings = np.empty((len(sentences), batches[0].shape[1]), dtype=np.float32)
+        embeddings[order] = np.concatenate(batches)
+        
+        if normalize_embeddings:
+            embeddings /= np.maximum(np.linalg.norm(embeddings, axis=1, keepdims=True), 1e-12)
+        return embeddings
 
 class TranscriptQASystem:
-    def __init__(self, transcript_dir: str = "transcripts", chunk_size: int = 500):
+    # Bump whenever chunking or embedding changes so stale caches are ignored
+    CACHE_VERSION = 3
+    
+    # Invariant prompt prefix. Keep it byte-for-byte identical across calls so
+    # Ollama can reuse the KV cache for it instead of re-running prefill.
+    SYSTEM_PREAMBLE = (
+        "You are a helpful AI assistant analyzing sales call transcripts. "
+        "Based on the provided transcript excerpts, answer the question concisely and accurately. "
+        "Focus only on the information present in the transcripts. "
+        "Do not include quotes or extra commentary.\n\n"
+    )
+    
+    # Number of chunks embedded per forward pass
+    EMBED_BATCH_SIZE = 64
+    
+    # Chunk count above which FAISS switches from exact search to an HNSW graph
+    HNSW_MIN_CHUNKS = 10000
+    
+    # How long Ollama keeps the model (and its prompt cache) loaded between questions
+    OLLAMA_KEEP_ALIVE = "60m"
+    
+    # Number of answers remembered across questions and runs
+    ANSWER_CACHE_SIZE = 128
+    
+    # Number of question embeddings kept in memory (~1.5 KB each)
+    QUESTION_EMBEDDING_CACHE_SIZE = 256
+    
+    def __init__(self, transcript_dir: str = "transcripts", chunk_size: int = 500,
+                 cache_dir: str = "cache", onnx_model_dir: str = "onnx_model"):
         """
         Initialize the Q&A system.
         
         Args:
             transcript_dir: Directory containing transcript files
-            chunk_size: Maximum character size for each chunk
+            chunk_size: Target character size for each chunk (capped by the embedding model's token window)
+            cache_dir: Directory where chunks and embeddings are cached between runs
+            onnx_model_dir: Directory with an ONNX export of the embedding model, used when present
         """
         self.transcript_dir = transcript_dir
         self.chunk_size = chunk_size
+        self.cache_dir = cache_dir
         
         # Initialize models
         print("Loading embedding model...")
-        self.embedding_model = SentenceTransformer('all-MiniLM-L6-v2')
+        self.embedding_model_name = 'all-MiniLM-L6-v2'
+        if ort is not None and os.path.exists(os.path.join(onnx_model_dir, "model.onnx")):
+            print(f"   Using ONNX Runtime model from {onnx_model_dir}/")
+            # Chunks are ~500 characters (~100 tokens), so a shorter window is plenty
+            self.embedding_model = OnnxEmbeddingModel(onnx_model_dir, max_seq_length=256)
+        else:
+            # Imported here so the PyTorch runtime is only loaded when it is needed
+            import torch
+            from sentence_transformers import SentenceTransformer
+            
+            self.embedding_model = SentenceTransformer(self.embedding_model_name)
+            # Chunks are ~500 characters (~100 tokens), so a shorter window is plenty
+            self.embedding_model.max_seq_length = 256
+            if torch.cuda.is_available():
+                self.embedding_model.half()
+        
+        # Run one tiny batch so buffers are allocated before the first real question
+        self.embedding_model.encode(["warmup"])
         
         print("Loading LLM model...")
         # Use Ollama for easier model management
         self.ollama_url = "http://localhost:11434"
         self.model_name = "llama3.2:3b"  # llm model
         
-        # Check if Ollama is running
+        # Reuse one keep-alive connection for all Ollama requests
+        self.session = requests.Session()
+        self.session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=0))
+        atexit.register(self.session.close)
+        # Async client for aanswer_question, created on first use inside the running event loop
+        self._aclient = None
+        
+        # Check once whether Ollama is running and has our model
+        self._ollama_ready = False
         try:
-            response = requests.get(f"{self.ollama_url}/api/tags")
+            response = self.session.get(f"{self.ollama_url}/api/tags")
             if response.status_code == 200:
                 print(f"   Ollama is running")
                 print(f"   Available models:")
-                models = response.json().get("models", [])
+                models = orjson.loads(response.content).get("models", [])
                 for model in models:
                     print(f"    - {model['name']}")
                 
@@ -58,6 +214,8 @@ class TranscriptQASystem:
                 model_names = [m['name'] for m in models]
                 if self.model_name in model_names:
                     print(f"   Model {self.model_name} is available")
+                    self._ollama_ready = True
+                    self._warm_up_llm()
                 else:
                     print(f"    Model {self.model_name} not found")
                     print(f"   Run: ollama pull {self.model_name}")
@@ -71,60 +229,139 @@ class TranscriptQASystem:
         self.chunks = []
         self.chunk_embeddings = []
         
-        # Load and process transcripts
-        self._load_transcripts()
-        self._create_chunks()
-        self._embed_chunks()
+        # Recently embedded questions, most recently used last. Guarded by a lock
+        # because aanswer_question runs retrieval on worker threads.
+        self._question_embedding_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._question_embedding_lock = threading.Lock()
         
-    def _load_transcripts(self):
-        """Load all transcript files from the transcripts directory."""
-        print(f"Loading transcripts from {self.transcript_dir}/...")
+        # Load chunks and embeddings from the cache, or process transcripts from scratch
+        self._corpus_key = self._cache_key()
+        cache_path = os.path.join(self.cache_dir, f"{self._corpus_key}.npz")
+        if not self._load_cache(cache_path):
+            self._process_transcripts()
+            self._save_cache(cache_path)
+        
+        self._build_search_index()
         
-        # Find all .txt files in the transcripts directory
-        transcript_files = glob.glob(os.path.join(self.transcript_dir, "*.txt"))
+        # Previously generated answers, most recently used last
+        self._answer_cache_path = os.path.join(self.cache_dir, "answers.json")
+        self._answer_cache = self._load_answer_cache()
+        atexit.register(self._save_answer_cache)
+    
+    def _warm_up_llm(self):
+        """Load the Ollama model weights now so the first question doesn't pay for it."""
+        print(f"   Loading {self.model_name} into memory...")
+        try:
+            self.session.post(
+                f"{self.ollama_url}/api/generate",
+                data=orjson.dumps({
+                    "model": self.model_name,
+                    "prompt": "",
+                    "stream": False,
+                    "keep_alive": self.OLLAMA_KEEP_ALIVE,
+                    "options": {"num_predict": 1}
+                }),
+                headers={"Content-Type": "application/json"}
+            ).close()
+        except Exception as e:
+            print(f"   Could not preload {self.model_name}: {e}")
+    
+    def _cache_key(self) -> str:
+        """Hash the transcript files and chunking settings into a cache key."""
+        hasher = hashlib.sha256()
+        for file_path in self._transcript_files():
+            with open(file_path, 'rb') as f:
+                content = f.read()
+            hasher.update(str(len(content)).encode())
+            hasher.update(content)
+        hasher.update(f"{self.chunk_size}:{self.embedding_model_name}:{self.CACHE_VERSION}".encode())
+        return hasher.hexdigest()
+    
+    def _load_cache(self, cache_path: str) -> bool:
+        """Load chunks and embeddings from a cache file. Returns True on success."""
+        if not os.path.exists(cache_path):
+            return False
+        
+        try:
+            with np.load(cache_path) as data:
+                self.chunks = data["chunks"].tolist()
+                self.chunk_embeddings = data["embeddings"].astype(np.float32)
+        except Exception as e:
+            print(f"Ignoring unreadable cache {cache_path}: {e}")
+            return False
+        
+        print(f"Loaded {len(self.chunks)} cached chunks and embeddings from {cache_path}")
+        return True
+    
+    def _save_cache(self, cache_path: str):
+        """Save chunks and embeddings so later runs can skip embedding."""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Write to a temporary file first so an interrupted run never leaves a partial cache
+            tmp_path = cache_path + ".tmp"
+            with open(tmp_path, 'wb') as f:
+                np.savez(f, chunks=np.array(self.chunks, dtype=str),
+                         embeddings=np.asarray(self.chunk_embeddings, dtype=np.float32))
+            os.replace(tmp_path, cache_path)
+            print(f"Cached chunks and embeddings to {cache_path}")
+        except OSError as e:
+            print(f"Could not write cache {cache_path}: {e}")
         
+    def _transcript_files(self) -> List[str]:
+        """Find all .txt files in the transcripts directory, in a stable order."""
+        return sorted(glob.glob(os.path.join(self.transcript_dir, "*.txt")))
+    
+    def _process_transcripts(self):
+        """
+        Load, chunk and embed all transcripts.
+        
+        A producer thread reads and chunks the files while this thread embeds
+        the batches produced so far, so disk I/O and chunking overlap with the
+        embedding model's forward passes.
+        """
+        print(f"Loading transcripts from {self.transcript_dir}/...")
+        
+        transcript_files = self._transcript_files()
         if not transcript_files:
             raise FileNotFoundError(f"No transcript files found in {self.transcript_dir}/")
         
-        self.transcripts = []
-        for file_path in transcript_files:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                self.transcripts.append(content)
-                print(f"  Loaded: {os.path.basename(file_path)} ({len(content)} characters)")
+        batches: "queue.Queue" = queue.Queue(maxsize=4)
+        producer = threading.Thread(
+            target=self._produce_chunk_batches, args=(transcript_files, batches), daemon=True
+        )
+        producer.start()
         
-        print(f"Total transcripts loaded: {len(self.transcripts)}")
-    
-    def _create_chunks(self):
-        """Split transcripts into smaller chunks for better context management."""
-        print("Creating text chunks...")
+        # Preallocate from a size estimate; grown below if the transcripts produce more chunks
+        capacity = sum(os.path.getsize(p) for p in transcript_files) // self.chunk_size + len(transcript_files)
+        embeddings = None
+        count = 0
         
-        for transcript in self.transcripts:
-            # Split by timestamp lines (e.g., "0:02", "1:15")
-            lines = transcript.split('\n')
-            current_chunk = ""
+        while True:
+            batch = batches.get()
+            if batch is None:
+                break
+            if isinstance(batch, Exception):
+                raise batch
             
-            for line in lines:
-                # Check if line is a timestamp (e.g., "0:02", "1:15")
-                if re.match(r'^\d+:\d+$', line.strip()):
-                    # If we have content in current_chunk and it's getting long, save it
-                    if len(current_chunk) > self.chunk_size and current_chunk.strip():
-                        self.chunks.append(current_chunk.strip())
-                        current_chunk = ""
-                    continue
-                
-                # Add line to current chunk
-                current_chunk += line + " "
-                
-                # If chunk is getting long, save it and start new one
-                if len(current_chunk) > self.chunk_size:
-                    if current_chunk.strip():
-                        self.chunks.append(current_chunk.strip())
-                        current_chunk = ""
+            batch_embeddings = self.embedding_model.encode(
+                batch,
+                batch_size=self.EMBED_BATCH_SIZE,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+            ).astype(np.float32)
+            
+            if embeddings is None:
+                embeddings = np.empty((max(capacity, len(batch)), batch_embeddings.shape[1]), dtype=np.float32)
+            elif count + len(batch) > len(embeddings):
+                grown = np.empty((max(2 * len(embeddings), count + len(batch)), embeddings.shape[1]), dtype=np.float32)
+                grown[:count] = embeddings[:count]
+                embeddings = grown
             
-            # Add any remaining content as final chunk
-            if current_chunk.strip():
-                self.chunks.append(current_chunk.strip())
+            embeddings[count:count + len(batch)] = batch_embeddings
+            self.chunks.extend(batch)
+            count += len(batch)
+        
+        producer.join()
         
         print(f"Created {len(self.chunks)} chunks")
         
@@ -132,15 +369,203 @@ class TranscriptQASystem:
         print("\nSample chunks:")
         for i, chunk in enumerate(self.chunks[:3]):
             print(f"  Chunk {i+1}: {chunk[:100]}...")
-    
-    def _embed_chunks(self):
-        """Create embeddings for all text chunks."""
-        print("Creating embeddings for chunks...")
         
-        # Create embeddings for all chunks
-        self.chunk_embeddings = self.embedding_model.encode(self.chunks)
+        if embeddings is None:
+            self.chunk_embeddings = np.empty((0, 0), dtype=np.float32)
+        else:
+            self.chunk_embeddings = embeddings[:count].copy()
         print(f"Embeddings created: {self.chunk_embeddings.shape}")
     
+    def _produce_chunk_batches(self, transcript_files: List[str], batches: "queue.Queue"):
+        """
+        Read and chunk transcripts, queueing chunks in batches for embedding.
+        
+        Runs on the producer thread started by _process_transcripts. Puts None
+        when finished, or the exception if anything fails.
+        
+        Args:
+            transcript_files: Paths of the transcripts to process
+            batches: Queue receiving lists of up to EMBED_BATCH_SIZE chunks
+        """
+        try:
+            # Tokenizers keep per-call state, so don't share one with the embedding thread
+            tokenizer = copy.deepcopy(self.embedding_model.tokenizer)
+            batch = []
+            
+            # Read files concurrently; reads release the GIL so slow disks overlap
+            with ThreadPoolExecutor(max_workers=min(8, len(transcript_files))) as executor:
+                contents = executor.map(self._read_transcript, transcript_files)
+                for file_path, content in zip(transcript_files, contents):
+                    print(f"  Loaded: {os.path.basename(file_path)} ({len(content)} characters)")
+                    
+                    for chunk in self._split_transcript(content, tokenizer):
+                        batch.append(chunk)
+                        if len(batch) == self.EMBED_BATCH_SIZE:
+                            batches.put(batch)
+                            batch = []
+            
+            if batch:
+                batches.put(batch)
+            print(f"Total transcripts loaded: {len(transcript_files)}")
+            batches.put(None)
+        except Exception as e:
+            batches.put(e)
+    
+    @staticmethod
+    def _read_transcript(file_path: str) -> str:
+        """Read a single transcript file."""
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return f.read()
+    
+    def _split_transcript(self, transcript: str, tokenizer=None) -> List[str]:
+        """
+        Split one transcript into chunks of roughly chunk_size characters.
+        
+        Args:
+            transcript: Raw transcript text
+            tokenizer: Tokenizer used to count tokens (defaults to the embedding model's)
+            
+        Returns:
+            List of chunk texts
+        """
+        # Drop timestamp lines (e.g., "0:02", "1:15") in one pass over the whole text
+        text = TIMESTAMP_RE.sub('', transcript)
+        lines = [line.strip() for line in text.splitlines()]
+        lines = [line for line in lines if line]
+        if not lines:
+            return []
+        
+        # Count tokens for every line in a single tokenizer call. Never let a chunk
+        # overflow the embedding model's window (leave room for special tokens).
+        if tokenizer is None:
+            tokenizer = self.embedding_model.tokenizer
+        token_counts = [len(ids) for ids in tokenizer(lines, add_special_tokens=False)["input_ids"]]
+        max_tokens = self.embedding_model.max_seq_length - 16
+        
+        chunks = []
+        buffer: List[str] = []
+        buffer_chars = 0
+        buffer_tokens = 0
+        
+        for line, line_tokens in zip(lines, token_counts):
+            # Save the buffer first if this line would push it past the token window
+            if buffer and buffer_tokens + line_tokens > max_tokens:
+                chunks.append(" ".join(buffer))
+                buffer, buffer_chars, buffer_tokens = [], 0, 0
+            
+            # Add line to current chunk
+            buffer.append(line)
+            buffer_chars += len(line) + 1
+            buffer_tokens += line_tokens
+            
+            # If chunk is getting long, save it and start new one
+            if buffer_chars > self.chunk_size:
+                chunks.append(" ".join(buffer))
+                buffer, buffer_chars, buffer_tokens = [], 0, 0
+        
+        # Add any remaining content as final chunk
+        if buffer:
+            chunks.append(" ".join(buffer))
+        
+        return chunks
+    
+    def _load_answer_cache(self) -> "OrderedDict[Tuple[str, str, str], str]":
+        """Load answers saved by previous runs, least recently used first."""
+        answers = OrderedDict()
+        try:
+            with open(self._answer_cache_path, 'rb') as f:
+                rows = orjson.loads(f.read())
+            # Each row is [corpus_key, model_name, normalized_question, answer]
+            for row in rows:
+                if not (isinstance(row, list) and len(row) == 4 and all(isinstance(v, str) for v in row)):
+                    raise ValueError(f"unexpected entry {row!r}")
+                answers[tuple(row[:3])] = row[3]
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Ignoring unreadable answer cache {self._answer_cache_path}: {e}")
+            return OrderedDict()
+        return answers
+    
+    def _save_answer_cache(self):
+        """Save remembered answers for the next run."""
+        if not self._answer_cache:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = self._answer_cache_path + ".tmp"
+            rows = [[*key, answer] for key, answer in self._answer_cache.items()]
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(rows))
+            os.replace(tmp_path, self._answer_cache_path)
+        except OSError as e:
+            print(f"Could not write answer cache {self._answer_cache_path}: {e}")
+    
+    def _answer_cache_key(self, question: str) -> Tuple[str, str, str]:
+        """Key answers on the transcripts, the LLM and the normalized question."""
+        normalized = " ".join(PUNCTUATION_RE.sub('', question.lower()).split())
+        return (self._corpus_key, self.model_name, normalized)
+    
+    def _remember_answer(self, key: Tuple[str, str, str], answer: str):
+        """Store an answer, evicting the least recently used one when full."""
+        self._answer_cache[key] = answer
+        self._answer_cache.move_to_end(key)
+        while len(self._answer_cache) > self.ANSWER_CACHE_SIZE:
+            self._answer_cache.popitem(last=False)
+    
+    def _build_search_index(self):
+        """Prepare the chunk embeddings for similarity search."""
+        self._index = None
+        
+        # Nothing to index; _find_relevant_chunks returns no results for an empty corpus
+        if len(self.chunks) == 0:
+            return
+        
+        # Row-normalize so cosine similarity is a plain dot product
+        norms = np.linalg.norm(self.chunk_embeddings, axis=1, keepdims=True)
+        chunk_matrix = (self.chunk_embeddings / norms).astype(np.float32)
+        
+        if faiss is not None:
+            # Exact SIMD inner-product search is fastest for small corpora;
+            # past that an HNSW graph keeps queries sub-linear
+            dim = chunk_matrix.shape[1]
+            if len(chunk_matrix) < self.HNSW_MIN_CHUNKS:
+                self._index = faiss.IndexFlatIP(dim)
+            else:
+                self._index = faiss.IndexHNSWFlat(dim, 32, faiss.METRIC_INNER_PRODUCT)
+            self._index.add(chunk_matrix)
+            return
+        
+        # Quantize to int8 with a per-row scale: a quarter of the bytes to stream per query
+        self._chunk_scale = (np.max(np.abs(chunk_matrix), axis=1) / 127.0).astype(np.float32)
+        self._chunk_q8 = np.round(chunk_matrix / self._chunk_scale[:, None]).astype(np.int8)
+    
+    def _embed_question(self, question: str) -> np.ndarray:
+        """
+        Embed a question, reusing the embedding if it was asked recently.
+        
+        Args:
+            question: The question to embed
+            
+        Returns:
+            Normalized float32 embedding, so the dot product is the cosine similarity
+        """
+        with self._question_embedding_lock:
+            question_embedding = self._question_embedding_cache.get(question)
+            if question_embedding is not None:
+                self._question_embedding_cache.move_to_end(question)
+                return question_embedding
+        
+        question_embedding = self.embedding_model.encode([question], normalize_embeddings=True)[0]
+        question_embedding = question_embedding.astype(np.float32)
+        
+        with self._question_embedding_lock:
+            self._question_embedding_cache[question] = question_embedding
+            while len(self._question_embedding_cache) > self.QUESTION_EMBEDDING_CACHE_SIZE:
+                self._question_embedding_cache.popitem(last=False)
+        
+        return question_embedding
+    
     def _find_relevant_chunks(self, question: str, top_k: int = 5) -> List[Tuple[str, float]]:
         """
         Find the most relevant chunks for a given question.
@@ -152,20 +577,29 @@ class TranscriptQASystem:
         Returns:
             List of (chunk_text, similarity_score) tuples
         """
-        # Embed the question
-        question_embedding = self.embedding_model.encode([question])
-        
-        # Calculate cosine similarity between question and all chunks
-        similarities = []
-        for chunk_embedding in self.chunk_embeddings:
-            # Calculate cosine similarity
-            similarity = np.dot(question_embedding[0], chunk_embedding) / (
-                np.linalg.norm(question_embedding[0]) * np.linalg.norm(chunk_embedding)
-            )
-            similarities.append(similarity)
+        if not self.chunks:
+            return []
+        top_k = min(top_k, len(self.chunks))
+        
+        question_embedding = self._embed_question(question)
+        
+        if self._index is not None:
+            scores, indices = self._index.search(question_embedding[np.newaxis, :], top_k)
+            return [(self.chunks[idx], float(score))
+                    for idx, score in zip(indices[0], scores[0]) if idx != -1]
+        
+        # Quantize the question the same way as the chunks
+        question_scale = np.max(np.abs(question_embedding)) / 127.0
+        question_q8 = np.round(question_embedding / question_scale).astype(np.int8)
+        
+        # Cosine similarity against all chunks in one integer matrix-vector product
+        # (int32 accumulation: int8 x int8 products summed over 384 dims overflow int16)
+        similarities = (self._chunk_q8 @ question_q8.astype(np.int32)).astype(np.float32)
+        similarities *= self._chunk_scale * np.float32(question_scale)
         
-        # Get top-k most similar chunks
-        top_indices = np.argsort(similarities)[-top_k:][::-1]
+        # Get top-k most similar chunks: partition in O(N), then sort only the k candidates
+        candidates = np.argpartition(similarities, -top_k)[-top_k:]
+        top_indices = candidates[np.argsort(-similarities[candidates])]
         
         relevant_chunks = []
         for idx in top_indices:
@@ -173,68 +607,231 @@ class TranscriptQASystem:
         
         return relevant_chunks
     
-    def answer_question(self, question: str) -> str:
+    def answer_question(self, question: str, stream: bool = False) -> str:
         """
         Answer a question based on the transcript content.
         
         Args:
             question: The question to answer
+            stream: Print the answer under an "Answer:" heading as it is generated
             
         Returns:
             A concise answer based on the transcript content
         """
         print(f"\nQuestion: {question}")
+        
+        # Repeated questions skip retrieval and generation entirely
+        cache_key = self._answer_cache_key(question)
+        if cache_key in self._answer_cache:
+            self._answer_cache.move_to_end(cache_key)
+            answer = self._answer_cache[cache_key]
+            print("Using cached answer")
+            if stream:
+                print("\nAnswer:")
+                print("-" * 40)
+                print(answer)
+                print("-" * 40)
+            return answer
+        
+        if not self._ollama_ready:
+            answer = self._ollama_unavailable_message()
+            if stream:
+                print(answer)
+            return answer
+        
         print("Searching for relevant information...")
         
         # Find relevant chunks
         relevant_chunks = self._find_relevant_chunks(question, top_k=3)
         
         if not relevant_chunks:
-            return "I couldn't find any relevant information in the transcripts to answer your question."
-        
-        # Prepare context for the LLM
-        context = "\n\n".join([chunk for chunk, score in relevant_chunks])
+            answer = "I couldn't find any relevant information in the transcripts to answer your question."
+            if stream:
+                print(answer)
+            return answer
         
-        # Create prompt for the LLM
-        prompt = f"""You are a helpful AI assistant analyzing sales call transcripts. Based on the provided transcript excerpts, answer the question concisely and accurately. Focus only on the information present in the transcripts. Do not include quotes or extra commentary.
-
-Question: {question}
-
-Relevant transcript excerpts:
-{context}
-
-Please provide a concise answer based only on the transcript information:"""
+        prompt = self._build_prompt(question, relevant_chunks)
         
         print("Generating answer using Ollama...")
+        if stream:
+            print("\nAnswer:")
+            print("-" * 40)
         
         try:
-            # Generate answer using Ollama
-            response = requests.post(
+            # Generate answer using Ollama, reading tokens as they are produced
+            response = self.session.post(
                 f"{self.ollama_url}/api/generate",
-                json={
-                    "model": self.model_name,
-                    "prompt": prompt,
-                    "stream": False,
-                    "options": {
-                        "temperature": 0.1,
-                        "top_p": 0.9,
-                        "max_tokens": 200
-                    }
-                }
+                data=orjson.dumps(self._generate_request(prompt, stream=True)),
+                headers={"Content-Type": "application/json"},
+                stream=True
+            )
+            
+            with response:
+                if response.status_code == 200:
+                    answer = self._read_stream(response, echo=stream)
+                    
+                    # Clean up the response
+                    answer = QUOTE_STRIP_RE.sub('', answer)
+                    self._remember_answer(cache_key, answer)
+                else:
+                    answer = f"Error generating answer: {response.status_code}"
+                    if stream:
+                        print(answer)
+                
+        except Exception as e:
+            answer = f"Error generating answer: {e}"
+            if stream:
+                print(answer)
+        
+        if stream:
+            print("-" * 40)
+        return answer
+    
+    async def aanswer_question(self, question: str) -> str:
+        """
+        Answer a question without blocking the event loop.
+        
+        Several questions can be answered concurrently with asyncio.gather;
+        Ollama generates them in parallel when OLLAMA_NUM_PARALLEL > 1.
+        Call aclose() before the event loop finishes.
+        
+        Args:
+            question: The question to answer
+            
+        Returns:
+            A concise answer based on the transcript content
+        """
+        cache_key = self._answer_cache_key(question)
+        if cache_key in self._answer_cache:
+            self._answer_cache.move_to_end(cache_key)
+            return self._answer_cache[cache_key]
+        
+        if not self._ollama_ready:
+            return self._ollama_unavailable_message()
+        
+        # Retrieval is CPU-bound, so run it in a worker thread while other answers generate
+        loop = asyncio.get_running_loop()
+        relevant_chunks = await loop.run_in_executor(None, self._find_relevant_chunks, question, 3)
+        
+        if not relevant_chunks:
+            return "I couldn't find any relevant information in the transcripts to answer your question."
+        
+        prompt = self._build_prompt(question, relevant_chunks)
+        
+        if self._aclient is None:
+            # Generation can take far longer than httpx's default 5 second timeout
+            self._aclient = httpx.AsyncClient(base_url=self.ollama_url, timeout=None)
+        
+        try:
+            response = await self._aclient.post(
+                "/api/generate",
+                content=orjson.dumps(self._generate_request(prompt, stream=False)),
+                headers={"Content-Type": "application/json"}
             )
             
             if response.status_code == 200:
-                result = response.json()
-                answer = result.get("response", "").strip()
+                answer = orjson.loads(response.content).get("response", "").strip()
                 
                 # Clean up the response
-                answer = re.sub(r'^["\']|["\']$', '', answer)
+                answer = QUOTE_STRIP_RE.sub('', answer)
+                self._remember_answer(cache_key, answer)
                 return answer
             else:
                 return f"Error generating answer: {response.status_code}"
                 
         except Exception as e:
             return f"Error generating answer: {e}"
+    
+    async def aclose(self):
+        """Close the async HTTP client used by aanswer_question."""
+        if self._aclient is not None:
+            await self._aclient.aclose()
+            self._aclient = None
+    
+    def _ollama_unavailable_message(self) -> str:
+        """Explain why no answer can be generated when Ollama wasn't ready at startup."""
+        return (f"Error generating answer: Ollama or model {self.model_name} was not available at startup. "
+                f"Start it with 'ollama serve', run 'ollama pull {self.model_name}', then restart.")
+    
+    def _build_prompt(self, question: str, relevant_chunks: List[Tuple[str, float]]) -> str:
+        """Create the LLM prompt from the question and its retrieved chunks."""
+        # Prepare context for the LLM
+        context = "\n\n".join([chunk for chunk, score in relevant_chunks])
+        
+        return self.SYSTEM_PREAMBLE + f"""Question: {question}
+
+Relevant transcript excerpts:
+{context}
+
+Please provide a concise answer based only on the transcript information:"""
+    
+    def _generate_request(self, prompt: str, stream: bool) -> Dict:
+        """Build the JSON body for an Ollama /api/generate call."""
+        return {
+            "model": self.model_name,
+            "prompt": prompt,
+            "stream": stream,
+            "keep_alive": self.OLLAMA_KEEP_ALIVE,
+            "options": {
+                "temperature": 0.1,
+                "top_p": 0.9,
+                "max_tokens": 200
+            }
+        }
+    
+    def _read_stream(self, response: requests.Response, echo: bool = False) -> str:
+        """
+        Assemble a streamed Ollama /api/generate response.
+        
+        Args:
+            response: Streaming response yielding one JSON object per line
+            echo: Print each token as soon as it arrives, dropping the surrounding
+                whitespace and wrapping quotes that answer_question strips
+            
+        Returns:
+            The full generated text
+        """
+        parts = []
+        # Echo state: the last non-blank token (plus any blank tokens after it) is held
+        # back so a closing quote can be dropped once the stream ends
+        started = False
+        pending = ""
+        
+        for line in response.iter_lines():
+            if not line:
+                continue
+            chunk = orjson.loads(line)
+            if "error" in chunk:
+                raise RuntimeError(chunk["error"])
+            
+            token = chunk.get("response", "")
+            parts.append(token)
+            if echo:
+                if not started:
+                    # Skip leading whitespace and drop an opening quote
+                    token = token.lstrip()
+                    if not token:
+                        continue
+                    if token[0] in "\"'":
+                        token = token[1:]
+                    started = True
+                
+                if token.strip():
+                    print(pending, end="", flush=True)
+                    pending = token
+                else:
+                    pending += token
+            
+            if chunk.get("done"):
+                break
+        
+        if echo:
+            # Drop trailing whitespace and a closing quote
+            pending = pending.rstrip()
+            if pending.endswith(("\"", "'")):
+                pending = pending[:-1]
+            print(pending)
+        return "".join(parts).strip()
 
 def main():
     """Main function to run the Q&A system."""
@@ -265,13 +862,8 @@ def main():
                 continue
             
             try:
-                # Get answer
-                answer = qa_system.answer_question(question)
-                
-                print("\nAnswer:")
-                print("-" * 40)
-                print(answer)
-                print("-" * 40)
+                # Get answer, printed as it is generated
+                qa_system.answer_question(question, stream=True)
                 
             except Exception as e:
                 print(f"Error generating answer: {e}")